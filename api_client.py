@@ -1,14 +1,23 @@
 # api_client.py
 
 import pandas as pd
+import config
+from core.fixture_feed import get_default_feed
+
+def register_team_names(all_results_df: pd.DataFrame):
+    """
+    Fikstürdeki takım adlarının all_results'taki adlara çevrilebilmesi için
+    eşleştirme tablosunu bir kez kurar.
+    """
+    get_default_feed().set_team_names(all_results_df)
 
 def get_todays_matches_by_league(league_code: str):
     """
-    Bu fonksiyon şimdilik devre dışı bırakılmıştır.
-    Fikstür çekme özelliği, ana uygulamanın stabilitesini korumak için
-    geçici olarak kapatılmıştır.
+    Bugünün maçlarını fikstür akışından (yerel klasör / HTTP) çeker.
+    Sonuçlar süreç genelinde FIXTURE_CACHE_TTL saniye önbellekte tutulur.
     """
-    # print("Fikstür çekme özelliği geçici olarak devre dışı.")
-    # Boş bir DataFrame döndürerek arayüzde hata çıkmasını engeller.
-    return pd.DataFrame()
+    return get_default_feed().get_matches(league_code)
 
+def get_todays_matches(league_codes=config.LEAGUE_CODES):
+    """Tüm liglerin bugünkü maçlarını eş zamanlı çeker."""
+    return get_default_feed().get_all(league_codes)
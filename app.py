@@ -7,7 +7,7 @@ import config
 from core.data_manager import DataManager
 from core.model_trainer import ModelTrainer
 from core.predictor import MatchPredictor
-from api_client import get_todays_matches_by_league
+from api_client import get_todays_matches, get_todays_matches_by_league, register_team_names
 
 # ===================== #
 #   SAYFA AYARLARI      #
@@ -27,10 +27,13 @@ def load_dependencies():
     all_results_df, elo_results_df = data_manager.load_all_data()
     trainer = ModelTrainer(all_results_df, elo_results_df)
     predictor = MatchPredictor(trainer)
+    register_team_names(all_results_df)
+    # Tüm liglerin fikstürü eş zamanlı çekilip önbelleğe alınır; lig seçimi önbellekten okunur
+    get_todays_matches(sorted(set(all_results_df['league_code'].unique()) & set(config.LEAGUE_CODES)))
     return predictor, all_results_df
 
 
-@st.cache_data(ttl=600)
+# Önbellek fikstür akışının içinde (tüm oturumlar için ortak), burada ayrıca cache yok
 def fetch_daily_matches(league_code):
     return get_todays_matches_by_league(league_code)
 
@@ -68,6 +71,7 @@ if selected_code:
     away_team = st.sidebar.selectbox("Deplasman", teams, index=min(1, len(teams) - 1))
 
     predict_btn = st.sidebar.button("ANALİZ ET", type="primary", use_container_width=True)
+    slate_btn = st.sidebar.button("GÜNÜN MAÇLARI", use_container_width=True)
 
 # ===================== #
 #   ANALİZ EKRANI       #
@@ -167,5 +171,28 @@ if selected_code and predict_btn:
                     df_a[['date', 'home_team', 'away_team', 'home_score', 'away_score']].rename(columns=col_rename),
                     hide_index=True)
 
+elif selected_code and slate_btn:
+    daily = fetch_daily_matches(selected_code)
+    st.markdown(f"### {selected_league_name} - Günün Maçları")
+
+    if daily.empty:
+        st.info("Bugün için fikstür bulunamadı.")
+    else:
+        slate_rows = []
+        with st.spinner("Günün maçları analiz ediliyor..."):
+            for _, m in daily.iterrows():
+                if m['home_team'] not in teams or m['away_team'] not in teams:
+                    slate_rows.append({"Ev": m['home_team'], "Dep": m['away_team'], "MS 1": "-", "MS X": "-",
+                                       "MS 2": "-", "2.5 ÜST": "-", "KG VAR": "-"})
+                    continue
+                out, _, _ = predictor.predict_match(m['home_team'], m['away_team'])
+                slate_rows.append({
+                    "Ev": m['home_team'], "Dep": m['away_team'],
+                    "MS 1": f"%{out['home_win'] * 100:.1f}", "MS X": f"%{out['draw'] * 100:.1f}",
+                    "MS 2": f"%{out['away_win'] * 100:.1f}", "2.5 ÜST": f"%{out['over25'] * 100:.1f}",
+                    "KG VAR": f"%{out['kg_var'] * 100:.1f}"
+                })
+        st.table(pd.DataFrame(slate_rows))
+
 elif not selected_code:
     st.info("👈 Analiz yapmak için soldan bir lig seçin.")
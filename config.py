@@ -2,6 +2,7 @@
 
 DATA_FOLDER = "data"
 MODELS_FOLDER = "models"
+HISTORY_FOLDER = "data/history"    # Derin geçmiş modunda sezonların biriktirildiği disk deposu
 
 # Lig listesini football-data.co.uk'de bulunan kodlarla güncelledik.
 # 'CL' kaldırıldı çünkü bu sitede standart lig formatında bulunmuyor.
@@ -23,3 +24,43 @@ K_FACTOR = 30
 
 CUTOFF_DATE = "2025-11-30"  # Açık: Sadece 30 Kasım'a kadar olan veriyi alır.
 CUTOFF_DATE = None        # Kapalı: Tüm güncel verileri alır.
+
+# --- SEZON SİMÜLASYONU AYARLARI ---
+SIM_N_SEASONS = 20000       # Lig başına simüle edilecek sezon sayısı
+SIM_BATCH_SIZE = 10000      # Bellek kontrolü için tek seferde işlenen sezon sayısı
+SIM_HOME_ADVANTAGE = 60     # Elo modunda ev sahibine eklenen puan
+# Lig başına (Avrupa kupası sıra sayısı, düşme sıra sayısı)
+LEAGUE_ZONES = {
+    'B1': (4, 2), 'D1': (6, 2), 'E0': (6, 3), 'F1': (5, 2), 'G1': (4, 2), 'I1': (6, 3),
+    'N1': (5, 2), 'P1': (5, 2), 'SC0': (4, 1), 'SP1': (6, 3), 'T1': (4, 4)
+}
+
+# --- ELO KALİBRASYON AYARLARI ---
+CALIBRATION_K_VALUES = [10, 15, 20, 25, 30, 35, 40, 50]
+# Lig ağırlıklarını 1.0'a doğru büzen/yayan çarpanlar (1.0 = mevcut tablo)
+CALIBRATION_WEIGHT_SCALES = [0.0, 0.5, 1.0, 1.5]
+CALIBRATION_RANDOM_SETS = 200     # Lig ağırlıkları rastgele oynatılmış ek parametre seti sayısı
+CALIBRATION_HOLDOUT = 0.2         # Son %20'lik maç dilimi log-loss ile puanlanır
+
+# --- BAHİS TARAYICI AYARLARI ---
+KELLY_FRACTION = 0.25   # Tam Kelly yerine çeyrek Kelly (varyansı azaltır)
+MIN_EDGE = 0.0          # Bu değerin üzerindeki beklenen değerler "değerli bahis" sayılır
+SCANNER_PRICE = 'avg'   # Edge/Kelly ve ödeme için oran: 'avg' (piyasa ortalaması) veya 'max' (en iyi oran, iyimser)
+
+# --- DERİN GEÇMİŞ AYARLARI (python train.py --train --deep-history) ---
+DEEP_HISTORY_FIRST_SEASON = 1993   # football-data.co.uk'te en eski sezon 1993/94
+INGEST_CHUNK_SIZE = 2000           # CSV'ler bu kadar satırlık parçalar halinde işlenir
+HISTORY_REFRESH_SEASONS = 2        # Her yüklemede depoya eklenmek üzere yeniden çekilen son sezonlar
+
+# --- FİKSTÜR AKIŞI AYARLARI ---
+FIXTURE_DROP_FOLDER = "data/fixtures"   # Buraya {lig_kodu}.csv veya {lig_kodu}.json bırakılabilir
+FIXTURE_FEED_URL = None                 # Örn: "http://localhost:8000/{league_code}.json"
+FIXTURE_CACHE_TTL = 600                 # Saniye (tüm oturumlar için ortak önbellek)
+FIXTURE_HTTP_TIMEOUT = 10
+# Fikstür kaynağındaki ad -> all_results'taki ad (otomatik eşleşmeyenler için)
+TEAM_ALIASES = {
+    'Manchester United': 'Man United', 'Manchester City': 'Man City', 'Nottingham Forest': "Nott'm Forest",
+    'Wolverhampton Wanderers': 'Wolves', 'Newcastle United': 'Newcastle', 'Tottenham Hotspur': 'Tottenham',
+    'Bayern München': 'Bayern Munich', 'Borussia Dortmund': 'Dortmund', 'Paris Saint-Germain': 'Paris SG',
+    'Inter Milan': 'Inter', 'AC Milan': 'Milan', 'Atletico Madrid': 'Ath Madrid', 'Athletic Bilbao': 'Ath Bilbao'
+}
@@ -1,6 +1,7 @@
 # core/data_manager.py
 
 import pandas as pd
+import numpy as np
 import os
 import time
 import requests
@@ -11,47 +12,110 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36'
 }
 
+# Bahis oranları: hedef sütun -> öncelik sırasıyla kaynak sütunlar
+# (Kapanış oranı yoksa açılış oranı, eski sezonlarda Betbrain ortalaması kullanılır)
+ODDS_SOURCES = {
+    'odds_home': ['AvgCH', 'AvgH', 'BbAvH'], 'odds_draw': ['AvgCD', 'AvgD', 'BbAvD'],
+    'odds_away': ['AvgCA', 'AvgA', 'BbAvA'],
+    'odds_over25': ['AvgC>2.5', 'Avg>2.5', 'BbAv>2.5'], 'odds_under25': ['AvgC<2.5', 'Avg<2.5', 'BbAv<2.5'],
+    'max_odds_home': ['MaxCH', 'MaxH', 'BbMxH'], 'max_odds_draw': ['MaxCD', 'MaxD', 'BbMxD'],
+    'max_odds_away': ['MaxCA', 'MaxA', 'BbMxA'],
+    'max_odds_over25': ['MaxC>2.5', 'Max>2.5', 'BbMx>2.5'], 'max_odds_under25': ['MaxC<2.5', 'Max<2.5', 'BbMx<2.5']
+}
+
+# YENİ: Şut (HS/AS), İsabetli Şut (HST/AST) ve Korner (HC/AC) eklendi
+RENAME_MAP = {
+    'Date': 'date', 'HomeTeam': 'home_team', 'AwayTeam': 'away_team',
+    'FTHG': 'home_score', 'FTAG': 'away_score',
+    'HTHG': 'ht_home_score', 'HTAG': 'ht_away_score',
+    'HS': 'home_shots', 'AS': 'away_shots',
+    'HST': 'home_shots_target', 'AST': 'away_shots_target',
+    'HC': 'home_corners', 'AC': 'away_corners'
+}
+
+# CSV okunurken sadece bu sütunlar ayrıştırılır (100+ sütunun geri kalanı hiç işlenmez)
+KEPT_COLUMNS = set(RENAME_MAP) | {col for sources in ODDS_SOURCES.values() for col in sources}
+COLUMN_DTYPES = {col: 'float32' for col in KEPT_COLUMNS}
+COLUMN_DTYPES.update({'Date': str, 'HomeTeam': str, 'AwayTeam': str})
+
+# Disk deposundaki sabit sütun sırası (eski sezonlarda olmayan sütunlar NaN kalır)
+STORE_COLUMNS = ['date', 'home_team', 'away_team', 'home_score', 'away_score', 'ht_home_score', 'ht_away_score',
+                 'home_shots', 'away_shots', 'home_shots_target', 'away_shots_target', 'home_corners',
+                 'away_corners', 'league_code'] + list(ODDS_SOURCES)
+
+
+def _parse_season_dates(values):
+    """
+    football-data tarihlerini çevirir. Aynı dosyada 14/08/2017 ve 14/08/17 birlikte bulunabildiği için
+    önce dört haneli yıl denenir, okunamayan satırlar iki haneli yıl ile tekrar denenir.
+    """
+    values = values.astype(str).str.strip()
+    dates = pd.to_datetime(values, format='%d/%m/%Y', errors='coerce')
+    return dates.fillna(pd.to_datetime(values.where(dates.isna()), format='%d/%m/%y', errors='coerce'))
+
 
 class DataManager:
-    def __init__(self, league_codes=config.LEAGUE_CODES):
+    def __init__(self, league_codes=config.LEAGUE_CODES, deep_history=False):
         self.league_codes = league_codes
+        self.deep_history = deep_history
+
+    def _extract_odds(self, df):
+        """Onlarca bahis sütunundan sadece ODDS_SOURCES'takileri float32 olarak çıkarır."""
+        odds = pd.DataFrame(index=df.index)
+        for target, sources in ODDS_SOURCES.items():
+            source = next((col for col in sources if col in df.columns), None)
+            if source is None:
+                odds[target] = np.float32(np.nan)
+            else:
+                odds[target] = pd.to_numeric(df[source], errors='coerce').astype('float32')
+        return odds
 
-    def _scrape_footballdata_data(self, league_code: str):
+    def _read_season_csv(self, url, chunksize=None, typed=True):
+        """
+        Sezon dosyasını sadece gerekli sütunlarla ve sabit tiplerle okur.
+        typed=False: Eski sezonlardaki bozuk sayısal değerler için her şeyi metin olarak okur.
+        """
+        return pd.read_csv(url, encoding='latin1', on_bad_lines='skip', usecols=lambda c: c in KEPT_COLUMNS,
+                           dtype=COLUMN_DTYPES if typed else str, chunksize=chunksize)
+
+    def _normalize_season(self, df, league_code):
+        """Ham sezon tablosunu ortak sütun adlarına çevirir, yoksa None döndürür."""
+        if not {'Date', 'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG'}.issubset(df.columns):
+            return None
+
+        odds = self._extract_odds(df)
+        existing_cols = [col for col in RENAME_MAP if col in df.columns]
+        df = df[existing_cols].rename(columns=RENAME_MAP)
+        for col in df.columns.difference(['date', 'home_team', 'away_team']):
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        df = pd.concat([df, odds], axis=1)
+
+        df['league_code'] = league_code
+        return df.dropna(subset=['date', 'home_team', 'away_team', 'home_score', 'away_score'])
+
+    def _scrape_footballdata_data(self, league_code: str, seasons_back=3):
         """
         football-data.co.uk'ten detaylı istatistiklerle veri çeker.
         """
         all_season_dfs = []
         current_year_short = int(time.strftime("%y"))
         seasons_to_check = [
-            f"{year - 1}{year}" for year in range(current_year_short + 1, current_year_short - 3, -1)
+            f"{year - 1}{year}" for year in range(current_year_short + 1, current_year_short - seasons_back, -1)
         ]
 
         print(f" football-data.co.uk'ten '{league_code}' verileri çekiliyor...")
         for season in seasons_to_check:
             try:
                 url = f"https://www.football-data.co.uk/mmz4281/{season}/{league_code}.csv"
-                df = pd.read_csv(url, encoding='latin1', on_bad_lines='skip')
-
-                # YENİ: Şut (HS/AS), İsabetli Şut (HST/AST) ve Korner (HC/AC) eklendi
-                rename_map = {
-                    'Date': 'date', 'HomeTeam': 'home_team', 'AwayTeam': 'away_team',
-                    'FTHG': 'home_score', 'FTAG': 'away_score',
-                    'HTHG': 'ht_home_score', 'HTAG': 'ht_away_score',
-                    'HS': 'home_shots', 'AS': 'away_shots',
-                    'HST': 'home_shots_target', 'AST': 'away_shots_target',
-                    'HC': 'home_corners', 'AC': 'away_corners'
-                }
+                try:
+                    df = self._read_season_csv(url)
+                except ValueError:
+                    df = self._read_season_csv(url, typed=False)
 
                 # Sütunları kontrol et ve seç
-                existing_cols = list(set(rename_map.keys()) & set(df.columns))
-                if not {'Date', 'HomeTeam', 'AwayTeam', 'FTHG', 'FTAG'}.issubset(df.columns):
+                df = self._normalize_season(df, league_code)
+                if df is None:
                     continue
-
-                df = df[existing_cols].copy()
-                df = df.rename(columns=rename_map)
-
-                df['league_code'] = league_code
-                df.dropna(subset=['date', 'home_team', 'away_team', 'home_score', 'away_score'], inplace=True)
                 all_season_dfs.append(df)
 
                 print(f"  -> {league_code} - {season} sezonu başarıyla çekildi.")
@@ -63,6 +127,112 @@ class DataManager:
         if not all_season_dfs: return pd.DataFrame()
         return pd.concat(all_season_dfs, ignore_index=True)
 
+    def _history_path(self, league_code):
+        return os.path.join(config.HISTORY_FOLDER, f"{league_code}.csv")
+
+    def _ingest_league_history(self, league_code, first_season=config.DEEP_HISTORY_FIRST_SEASON):
+        """
+        Bir ligin tüm sezonlarını parça parça okuyup disk deposuna (HISTORY_FOLDER) yazar.
+        Bellekte aynı anda en fazla bir parça (INGEST_CHUNK_SIZE satır) tutulur.
+        """
+        os.makedirs(config.HISTORY_FOLDER, exist_ok=True)
+        path = self._history_path(league_code)
+        tmp_path = path + ".tmp"
+        last_season = int(time.strftime("%Y"))
+        n_seasons, n_rows = 0, 0
+
+        print(f" football-data.co.uk'ten '{league_code}' için {first_season}'den bu yana tüm sezonlar çekiliyor...")
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            pd.DataFrame(columns=STORE_COLUMNS).to_csv(f, index=False)
+
+            for year in range(first_season, last_season + 1):
+                season = f"{year % 100:02d}{(year + 1) % 100:02d}"
+                url = f"https://www.football-data.co.uk/mmz4281/{season}/{league_code}.csv"
+                season_start = f.tell()
+
+                # Önce sabit tiplerle dene, bozuk değer çıkarsa sezonu metin olarak baştan oku
+                for typed in (True, False):
+                    season_rows, season_dropped = 0, 0
+                    try:
+                        for chunk in self._read_season_csv(url, chunksize=config.INGEST_CHUNK_SIZE, typed=typed):
+                            chunk = self._normalize_season(chunk, league_code)
+                            if chunk is None:
+                                break
+                            chunk = chunk.assign(date=_parse_season_dates(chunk['date']))
+                            season_dropped += int(chunk['date'].isna().sum())
+                            chunk = chunk.dropna(subset=['date']).reindex(columns=STORE_COLUMNS)
+                            chunk.to_csv(f, header=False, index=False, date_format='%Y-%m-%d')
+                            season_rows += len(chunk)
+                        break
+                    except ValueError:
+                        f.seek(season_start)
+                        f.truncate()
+                        season_rows, season_dropped = 0, 0
+                    except Exception:
+                        # Sezon dosyası yok (lig o yıl kapsanmıyor) veya indirilemedi
+                        f.seek(season_start)
+                        f.truncate()
+                        season_rows, season_dropped = 0, 0
+                        break
+
+                if season_dropped:
+                    print(f"  -> UYARI: {league_code} - {season}: tarihi okunamayan {season_dropped} maç atlandı.")
+                if season_rows:
+                    n_seasons += 1
+                    n_rows += season_rows
+                    print(f"  -> {league_code} - {season} sezonu depoya yazıldı.")
+                time.sleep(1)
+
+        os.replace(tmp_path, path)
+        print(f"  -> {league_code}: {n_seasons} sezon, {n_rows} maç '{path}' dosyasına kaydedildi.")
+
+    def ingest_deep_history(self, first_season=config.DEEP_HISTORY_FIRST_SEASON):
+        """Tüm kulüp ligleri için disk deposunu baştan oluşturur."""
+        for code in self.league_codes:
+            if code != 'INT':
+                self._ingest_league_history(code, first_season)
+
+    def _load_history_store(self, league_code):
+        path = self._history_path(league_code)
+        if not os.path.exists(path):
+            # Depo şimdi oluşturuldu, son sezonlar zaten içinde
+            self._ingest_league_history(league_code)
+            fresh = True
+        else:
+            fresh = False
+
+        dtypes = {col: 'float32' for col in STORE_COLUMNS}
+        dtypes.update({'date': str, 'home_team': str, 'away_team': str, 'league_code': str})
+        history = pd.read_csv(path, dtype=dtypes, parse_dates=['date'])
+        if fresh:
+            return history
+
+        # Depodaki son maçın sezonundan bugüne kadarki sezonlar (en az HISTORY_REFRESH_SEASONS) yeniden çekilir,
+        # böylece uzun süre güncellenmeyen depoda da arada kalan sezon eksik kalmaz
+        last_date = history['date'].max()
+        last_season_end = last_date.year + 1 if last_date.month >= 7 else last_date.year
+        seasons_back = max(config.HISTORY_REFRESH_SEASONS, int(time.strftime("%Y")) - last_season_end + 1)
+        recent = self._scrape_footballdata_data(league_code, seasons_back=seasons_back)
+        if recent.empty:
+            print(f"  -> UYARI: {league_code} son sezonları çekilemedi, depo '{path}' son güncellendiği tarihte kalıyor.")
+            return history
+
+        recent = recent.reindex(columns=STORE_COLUMNS)
+        recent['date'] = _parse_season_dates(recent['date'])
+        dropped = int(recent['date'].isna().sum())
+        if dropped:
+            print(f"  -> UYARI: {league_code} son sezonlarında tarihi okunamayan {dropped} maç atlandı.")
+        recent = recent.dropna(subset=['date'])
+        merged = pd.concat([history, recent], ignore_index=True)
+        merged = merged.drop_duplicates(subset=['date', 'home_team', 'away_team'], keep='last')
+        merged = merged.sort_values('date', kind='stable').reset_index(drop=True)
+
+        # Yenilenen sezonlar depoya geri yazılır; yarım kalan yazım depoyu bozmasın diye önce geçici dosyaya
+        tmp_path = path + ".tmp"
+        merged.to_csv(tmp_path, index=False, date_format='%Y-%m-%d')
+        os.replace(tmp_path, path)
+        return merged
+
     def _scrape_international_data(self):
         """
         Milli maç verisi (Detaylı istatistik içermez, sadece skor).
@@ -98,6 +268,8 @@ class DataManager:
             df = pd.DataFrame()
             if code == 'INT':
                 df = self._scrape_international_data()
+            elif self.deep_history:
+                df = self._load_history_store(code)
             else:
                 df = self._scrape_footballdata_data(code)
             if not df.empty:
@@ -135,6 +307,12 @@ class DataManager:
             else:
                 final_df[col] = final_df[col].fillna(0).astype(int)
 
+        # Bahis oranları: Yoksa NaN bırak (0 oran anlamsız), bellek için float32 tut
+        for col in ODDS_SOURCES:
+            if col not in final_df.columns:
+                final_df[col] = np.nan
+            final_df[col] = final_df[col].astype('float32')
+
         final_df.dropna(subset=['date', 'home_team', 'away_team', 'home_score', 'away_score'], inplace=True)
         final_df['home_score'] = final_df['home_score'].astype(int)
         final_df['away_score'] = final_df['away_score'].astype(int)
@@ -0,0 +1,143 @@
+# core/elo_calibrator.py
+
+import numpy as np
+import pandas as pd
+import os
+import config
+
+
+class EloCalibrator:
+    def __init__(self, elo_results_df, seed=42):
+        """
+        K_FACTOR ve LEAGUE_WEIGHTS için çok sayıda parametre setini tek bir maç taramasında dener.
+        Her maç, (takım x parametre seti) boyutlu bir Elo matrisini günceller.
+        """
+        self.elo_results = elo_results_df.sort_values('date').reset_index(drop=True)
+        self.rng = np.random.default_rng(seed)
+
+        teams = sorted(set(self.elo_results['home_team']) | set(self.elo_results['away_team']))
+        self.team_index = {team: i for i, team in enumerate(teams)}
+
+        league_codes = self.elo_results.get('league_code', pd.Series('E0', index=self.elo_results.index))
+        # Sadece maç kaydında bulunan ligler ayarlanır; diğerlerinin ağırlığı hiç puanlanmadığı için korunur
+        self.leagues = sorted(set(league_codes))
+        league_index = {code: i for i, code in enumerate(self.leagues)}
+
+        # Maç kaydını bir kez diziye çevir
+        self.home_idx = self.elo_results['home_team'].map(self.team_index).to_numpy()
+        self.away_idx = self.elo_results['away_team'].map(self.team_index).to_numpy()
+        self.league_idx = league_codes.map(league_index).to_numpy()
+        hs, as_ = self.elo_results['home_score'].to_numpy(), self.elo_results['away_score'].to_numpy()
+        self.score_home = np.where(hs > as_, 1.0, np.where(hs == as_, 0.5, 0.0))
+
+    def build_param_sets(self, k_values=config.CALIBRATION_K_VALUES,
+                         weight_scales=config.CALIBRATION_WEIGHT_SCALES,
+                         n_random=config.CALIBRATION_RANDOM_SETS):
+        """
+        Aday parametre setlerini üretir: K değerleri x ağırlık ölçekleri ızgarası
+        ve lig ağırlıkları rastgele oynatılmış ek setler (weight_scale=None).
+        """
+        self.k_values, self.weight_scales = list(k_values), list(weight_scales)
+        base = np.array([config.LEAGUE_WEIGHTS.get(code, 0.5) for code in self.leagues])
+        param_sets = []
+
+        for k in k_values:
+            for scale in weight_scales:
+                weights = np.clip(1 + scale * (base - 1), 0.05, None)
+                param_sets.append({'k_factor': float(k), 'weight_scale': scale,
+                                   'league_weights': dict(zip(self.leagues, weights.round(3)))})
+
+        for _ in range(n_random):
+            k = self.rng.choice(k_values)
+            weights = base * np.exp(self.rng.normal(0, 0.3, size=len(base)))
+            param_sets.append({'k_factor': float(k), 'weight_scale': None,
+                               'league_weights': dict(zip(self.leagues, weights.round(3)))})
+
+        return param_sets
+
+    def evaluate(self, param_sets, holdout=config.CALIBRATION_HOLDOUT):
+        """
+        Maç kaydını parametre ekseniyle bir kez oynatır.
+        Son 'holdout' diliminde, güncellemeden önceki Elo beklenen skorunun log-loss'u hesaplanır.
+        """
+        n_params = len(param_sets)
+        n_matches = len(self.elo_results)
+        holdout_start = int(n_matches * (1 - holdout))
+
+        # (lig x parametre) etkin K matrisi
+        k_matrix = np.array([[p['k_factor'] * p['league_weights'].get(code, 0.5) for p in param_sets]
+                             for code in self.leagues])
+
+        # Takım satırları bitişik olsun diye (takım x parametre) tutulur
+        ratings = np.full((len(self.team_index), n_params), float(config.INITIAL_ELO))
+        loss = np.zeros(n_params)
+
+        print(f"EloCalibrator: {n_params} parametre seti {n_matches} maç üzerinde deneniyor...")
+        for i in range(n_matches):
+            h, a, s = self.home_idx[i], self.away_idx[i], self.score_home[i]
+            rating_h, rating_a = ratings[h], ratings[a]
+
+            expected_h = 1 / (1 + np.power(10, (rating_a - rating_h) / 400))
+            if i >= holdout_start:
+                e = np.clip(expected_h, 1e-12, 1 - 1e-12)
+                loss -= s * np.log(e) + (1 - s) * np.log(1 - e)
+
+            delta = k_matrix[self.league_idx[i]] * (s - expected_h)
+            ratings[h] = rating_h + delta
+            ratings[a] = rating_a - delta
+
+        results = pd.DataFrame({
+            'k_factor': [p['k_factor'] for p in param_sets],
+            'log_loss': loss / max(n_matches - holdout_start, 1)
+        })
+        results['param_id'] = np.arange(n_params)
+        return results.sort_values('log_loss').reset_index(drop=True)
+
+    def normalize_param_set(self, param_set):
+        """
+        Etkin K (K x ağırlık) değişmeden ağırlıkları E0 = 1.00 olacak şekilde ölçekler, farkı K'ya aktarır.
+        Rastgele setler tüm ağırlıkları birlikte kaydırabildiği için karşılaştırma bu biçimde yapılmalıdır.
+        """
+        anchor = param_set['league_weights'].get('E0')
+        if not anchor:
+            return param_set
+        weights = {code: round(w / anchor, 3) for code, w in param_set['league_weights'].items()}
+        return dict(param_set, k_factor=param_set['k_factor'] * anchor, league_weights=weights)
+
+    def write_suggested_config(self, param_set, log_loss, path=None):
+        """En iyi parametre setini config.py'ye kopyalanabilecek biçimde dosyaya yazar."""
+        path = path or os.path.join(config.MODELS_FOLDER, "elo_suggested_config.py")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        # Kayıtta olmayan liglerin mevcut ağırlıkları olduğu gibi kalır
+        league_weights = dict(config.LEAGUE_WEIGHTS)
+        league_weights.update(param_set['league_weights'])
+        weights = ", ".join(f"'{code}': {w:.2f}" for code, w in league_weights.items())
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("# EloCalibrator tarafından önerilen ayarlar\n")
+            f.write(f"# Holdout log-loss: {log_loss:.5f}\n\n")
+            f.write(f"LEAGUE_WEIGHTS = {{{weights}}}\n")
+            f.write(f"K_FACTOR = {param_set['k_factor']:.1f}\n")
+        return path
+
+    def run(self):
+        param_sets = self.build_param_sets()
+        results = self.evaluate(param_sets)
+
+        best = results.iloc[0]
+        best_params = self.normalize_param_set(param_sets[int(best['param_id'])])
+        path = self.write_suggested_config(best_params, best['log_loss'])
+
+        current = self.evaluate([{'k_factor': config.K_FACTOR, 'league_weights': config.LEAGUE_WEIGHTS}])
+        print(f"  -> Mevcut ayarların log-loss'u: {current['log_loss'].iloc[0]:.5f}")
+        print(f"  -> En iyi log-loss: {best['log_loss']:.5f} (K={best_params['k_factor']:.1f})")
+        print(f"  -> Önerilen ayarlar '{path}' dosyasına yazıldı.")
+
+        # En iyi set ızgaranın kenarındaysa gerçek optimum ızgaranın dışında olabilir
+        if not min(self.k_values) < best_params['k_factor'] < max(self.k_values):
+            print(f"  -> UYARI: En iyi K ({best_params['k_factor']:.1f}) CALIBRATION_K_VALUES sınırında, "
+                  f"aralığı genişletip tekrar deneyin.")
+        if best_params['weight_scale'] in (min(self.weight_scales), max(self.weight_scales)) and best_params['weight_scale'] != 0:
+            print(f"  -> UYARI: En iyi ağırlık ölçeği ({best_params['weight_scale']:g}) "
+                  f"CALIBRATION_WEIGHT_SCALES sınırında, aralığı genişletip tekrar deneyin.")
+        return results, best_params
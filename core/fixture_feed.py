@@ -0,0 +1,230 @@
+# core/fixture_feed.py
+
+import pandas as pd
+import os
+import io
+import json
+import re
+import time
+import threading
+import unicodedata
+import requests
+from dateutil import tz
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+import config
+from core.utils import clean_team_name
+from core.data_manager import HEADERS, ODDS_SOURCES
+
+FIXTURE_COLUMNS = ['date', 'league_code', 'home_team', 'away_team']
+
+# Sağlayıcılardan gelebilecek farklı sütun adları -> ortak ad
+COLUMN_ALIASES = {
+    'Date': 'date', 'HomeTeam': 'home_team', 'AwayTeam': 'away_team', 'home': 'home_team', 'away': 'away_team',
+    'Div': 'league_code', 'league': 'league_code'
+}
+
+# Takım adlarında anlam taşımayan ekler (eşleştirmede yok sayılır)
+_NAME_NOISE = {'fc', 'cf', 'afc', 'sc', 'ac', 'sk', 'club', 'de', 'the'}
+
+
+def _name_key(name):
+    """Takım adını karşılaştırma anahtarına çevirir: aksan, noktalama ve 'FC' gibi ekler atılır."""
+    name = unicodedata.normalize('NFKD', clean_team_name(str(name))).encode('ascii', 'ignore').decode()
+    tokens = [t for t in re.split(r'[^a-z0-9]+', name.lower()) if t and t not in _NAME_NOISE]
+    return " ".join(tokens)
+
+
+def build_team_lookup(all_results_df):
+    """all_results'taki kanonik takım adları için anahtar -> ad sözlüğü kurar."""
+    names = set(all_results_df['home_team']) | set(all_results_df['away_team'])
+    lookup = {_name_key(name): name for name in names}
+    for alias, canonical in config.TEAM_ALIASES.items():
+        if canonical in names:
+            lookup[_name_key(alias)] = canonical
+    return lookup
+
+
+def _parse_dates(values):
+    """
+    Fikstür tarihlerini yerel saatte, saat dilimsiz Timestamp'e çevirir.
+    Saat dilimli değerler (2026-10-19T19:30:00Z) yerel saate çevrilir, dilimsizler olduğu gibi alınır;
+    ISO (2025-08-16) ve football-data (16/08/2025) biçimleri birlikte desteklenir.
+    """
+    raw = values.astype(str).str.strip()
+    has_tz = raw.str.contains(r'(?:Z|[+-]\d{2}:?\d{2})$', regex=True)
+
+    aware = pd.to_datetime(raw.where(has_tz), errors='coerce', utc=True, format='ISO8601')
+    aware = aware.dt.tz_convert(tz.tzlocal()).dt.tz_localize(None)
+
+    naive_raw = raw.where(~has_tz)
+    naive = pd.to_datetime(naive_raw, errors='coerce', format='ISO8601')
+    naive = naive.fillna(pd.to_datetime(naive_raw.where(naive.isna()), errors='coerce', dayfirst=True))
+    return aware.fillna(naive)
+
+
+def _parse_payload(content, is_json):
+    """CSV ya da JSON (kayıt listesi veya {"matches": [...]}) içeriği DataFrame'e çevirir."""
+    if is_json:
+        data = json.loads(content)
+        if isinstance(data, dict):
+            data = data.get('matches', [])
+        return pd.DataFrame(data)
+    try:
+        text = content.decode('utf-8')
+    except UnicodeDecodeError:
+        text = content.decode('latin1')
+    return pd.read_csv(io.StringIO(text), on_bad_lines='skip')
+
+
+class LocalDropProvider:
+    def __init__(self, folder=config.FIXTURE_DROP_FOLDER):
+        """Klasöre bırakılan {lig_kodu}.csv veya {lig_kodu}.json dosyalarından fikstür okur."""
+        self.folder = folder
+
+    def fetch(self, league_code):
+        for ext in ('json', 'csv'):
+            path = os.path.join(self.folder, f"{league_code}.{ext}")
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return _parse_payload(f.read(), is_json=(ext == 'json'))
+        return None
+
+
+class HttpFixtureProvider:
+    def __init__(self, url_template=config.FIXTURE_FEED_URL, timeout=config.FIXTURE_HTTP_TIMEOUT, pool_size=16):
+        """
+        url_template: '{league_code}' içeren adres (Örn: "http://localhost:8000/{league_code}.json").
+        ETag / Last-Modified ile koşullu GET yapar; değişmeyen fikstür tekrar indirilmez.
+        """
+        self.url_template = url_template
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # url -> (etag, last_modified, DataFrame)
+        self._validators = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, league_code):
+        url = self.url_template.format(league_code=league_code)
+        with self._lock:
+            etag, last_modified, cached = self._validators.get(url, (None, None, None))
+
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached is not None:
+            return cached
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+
+        is_json = 'json' in response.headers.get('Content-Type', '') or url.endswith('.json')
+        df = _parse_payload(response.content, is_json)
+        with self._lock:
+            self._validators[url] = (response.headers.get('ETag'), response.headers.get('Last-Modified'), df)
+        return df
+
+
+class FixtureFeed:
+    def __init__(self, providers, ttl=config.FIXTURE_CACHE_TTL, team_lookup=None):
+        """
+        Sağlayıcıları sırayla dener; ilk boş olmayan sonuç kullanılır.
+        Sonuçlar bu akışa ait önbellekte ttl saniye tutulur; süreç genelinde paylaşım get_default_feed() ile olur.
+        """
+        self.providers = providers
+        self.ttl = ttl
+        self.team_lookup = team_lookup or {}
+        # (lig_kodu, tarih) -> (zaman damgası, DataFrame)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    def set_team_names(self, all_results_df):
+        self.team_lookup = build_team_lookup(all_results_df)
+        self.clear_cache()
+
+    def _resolve(self, name):
+        return self.team_lookup.get(_name_key(name), clean_team_name(name))
+
+    def _normalize(self, df, league_code, day):
+        df = df.rename(columns=COLUMN_ALIASES)
+        if not {'home_team', 'away_team'}.issubset(df.columns):
+            return pd.DataFrame(columns=FIXTURE_COLUMNS)
+
+        if 'league_code' not in df.columns:
+            df['league_code'] = league_code
+        df = df[df['league_code'] == league_code].copy()
+
+        if 'date' in df.columns:
+            df['date'] = _parse_dates(df['date'])
+            df = df[df['date'].dt.normalize() == day]
+        else:
+            df['date'] = day
+
+        df['home_team'] = df['home_team'].map(self._resolve)
+        df['away_team'] = df['away_team'].map(self._resolve)
+
+        # Oran sütunları varsa MarketScanner için bırak
+        odds_cols = [col for col in ODDS_SOURCES if col in df.columns]
+        return df[FIXTURE_COLUMNS + odds_cols].reset_index(drop=True)
+
+    def get_matches(self, league_code, day=None):
+        day = pd.Timestamp(day or 'today').normalize()
+        key = (league_code, day)
+        with self._cache_lock:
+            hit = self._cache.get(key)
+        if hit and time.time() - hit[0] < self.ttl:
+            return hit[1]
+
+        df = pd.DataFrame(columns=FIXTURE_COLUMNS)
+        for provider in self.providers:
+            # Tek bir sağlayıcının/ligin bozuk verisi diğer ligleri düşürmesin
+            try:
+                raw = provider.fetch(league_code)
+                if raw is None or raw.empty:
+                    continue
+                df = self._normalize(raw, league_code, day)
+                break
+            except Exception as e:
+                print(f"  -> HATA: {league_code} fikstürü {type(provider).__name__} ile çekilemedi: {e}")
+                continue
+
+        with self._cache_lock:
+            self._cache[key] = (time.time(), df)
+        return df
+
+    def get_all(self, league_codes=config.LEAGUE_CODES, day=None):
+        """Tüm liglerin fikstürünü eş zamanlı çeker ve tek tabloda birleştirir."""
+        with ThreadPoolExecutor(max_workers=max(len(league_codes), 1)) as pool:
+            frames = list(pool.map(lambda code: self.get_matches(code, day), league_codes))
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=FIXTURE_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+
+_default_feed = None
+_default_feed_lock = threading.Lock()
+
+
+def get_default_feed():
+    """config'teki ayarlarla kurulan, süreç başına tek FixtureFeed."""
+    global _default_feed
+    with _default_feed_lock:
+        if _default_feed is None:
+            providers = [LocalDropProvider()]
+            if config.FIXTURE_FEED_URL:
+                providers.append(HttpFixtureProvider())
+            _default_feed = FixtureFeed(providers)
+        return _default_feed
@@ -0,0 +1,144 @@
+# core/market_scanner.py
+
+import numpy as np
+import pandas as pd
+import config
+
+# Pazar -> (model çıktısı anahtarı, ortalama oran sütunu, en iyi oran sütunu, pazar grubu)
+MARKETS = {
+    'MS 1': ('home_win', 'odds_home', 'max_odds_home', '1X2'),
+    'MS X': ('draw', 'odds_draw', 'max_odds_draw', '1X2'),
+    'MS 2': ('away_win', 'odds_away', 'max_odds_away', '1X2'),
+    '2.5 ÜST': ('over25', 'odds_over25', 'max_odds_over25', 'OU25'),
+    '2.5 ALT': ('under25', 'odds_under25', 'max_odds_under25', 'OU25')
+}
+
+
+class MarketScanner:
+    def __init__(self, predictor=None, kelly_fraction=config.KELLY_FRACTION, min_edge=config.MIN_EDGE,
+                 price=config.SCANNER_PRICE):
+        """
+        Fikstür listesi ve oranları üzerinden tüm maçlar ve tüm pazarlar için
+        marjsız olasılık, model avantajı (edge) ve Kelly bahis oranını hesaplar.
+        price: Tüm hesaplarda (marj, edge, Kelly, ödeme) kullanılan tek oran; 'avg' veya 'max'.
+        """
+        if price not in ('avg', 'max'):
+            raise ValueError(f"Geçersiz oran türü: '{price}' ('avg' veya 'max' olmalı).")
+        self.predictor = predictor
+        self.price = price
+        self.kelly_fraction = kelly_fraction
+        self.min_edge = min_edge
+        self.market_names = list(MARKETS)
+        self.model_keys = [m[0] for m in MARKETS.values()]
+        self.odds_cols = [m[1] for m in MARKETS.values()]
+        self.max_odds_cols = [m[2] for m in MARKETS.values()]
+        self.groups = np.array([m[3] for m in MARKETS.values()])
+
+    def model_probabilities(self, fixtures):
+        """Her maç için MatchPredictor çıktılarını (pazar sırasıyla) döndürür."""
+        if self.predictor is None:
+            raise ValueError("Model olasılıkları için MatchPredictor gerekli.")
+        rows = []
+        for home, away in zip(fixtures['home_team'], fixtures['away_team']):
+            out, _, _ = self.predictor.predict_match(home, away)
+            rows.append([out[key] for key in self.model_keys])
+        return pd.DataFrame(rows, columns=self.model_keys, index=fixtures.index)
+
+    def _odds_matrix(self, fixtures):
+        odds = fixtures.reindex(columns=self.odds_cols).to_numpy(dtype=np.float64)
+        if self.price == 'max':
+            best = fixtures.reindex(columns=self.max_odds_cols).to_numpy(dtype=np.float64)
+            # En iyi oran yoksa ortalama orana dön
+            odds = np.where(np.isnan(best), odds, best)
+        return np.where(odds > 1, odds, np.nan)
+
+    def _fair_probabilities(self, odds):
+        """Her pazar grubunda 1/oran değerlerini normalize ederek bahisçi marjını çıkarır."""
+        implied = 1 / odds
+        fair = np.empty_like(implied)
+        margin = np.empty_like(implied)
+        for group in np.unique(self.groups):
+            cols = self.groups == group
+            total = implied[:, cols].sum(axis=1, keepdims=True)
+            fair[:, cols] = implied[:, cols] / total
+            margin[:, cols] = total - 1
+        return implied, fair, margin
+
+    def _evaluate(self, fixtures, probabilities):
+        if probabilities is None:
+            probabilities = self.model_probabilities(fixtures)
+        model = probabilities.reindex(columns=self.model_keys).to_numpy(dtype=np.float64)
+
+        # Marj, edge ve ödeme aynı orandan hesaplanır; aksi halde edge şişer
+        odds = self._odds_matrix(fixtures)
+        implied, fair, margin = self._fair_probabilities(odds)
+
+        edge = model * odds - 1                     # Beklenen değer (1 birim bahis başına)
+        kelly = np.clip(edge / (odds - 1), 0, None) * self.kelly_fraction
+        return {
+            'model': model, 'odds': odds, 'implied': implied,
+            'fair': fair, 'margin': margin, 'edge': edge, 'kelly': kelly
+        }
+
+    def scan(self, fixtures, probabilities=None):
+        """
+        fixtures: 'home_team', 'away_team' ve oran sütunlarını (odds_home, max_odds_home, ...) içeren tablo.
+        probabilities verilmezse MatchPredictor ile hesaplanır. predict_match bugünkü Elo ve form ile
+        çalıştığı için canlı çıktısı sadece burada (oynanmamış maçlar için) geçerlidir.
+        Maç x pazar satırlarından oluşan, edge'e göre sıralı tek bir tablo döndürür.
+        """
+        res = self._evaluate(fixtures, probabilities)
+        n_fixtures, n_markets = res['odds'].shape
+
+        table = pd.DataFrame({
+            'home_team': np.repeat(fixtures['home_team'].to_numpy(), n_markets),
+            'away_team': np.repeat(fixtures['away_team'].to_numpy(), n_markets),
+            'market': np.tile(self.market_names, n_fixtures),
+            'odds': res['odds'].ravel(),
+            'implied_prob': res['implied'].ravel(),
+            'fair_prob': res['fair'].ravel(),
+            'margin': res['margin'].ravel(),
+            'model_prob': res['model'].ravel(),
+            'edge': res['edge'].ravel(),
+            'kelly_stake': res['kelly'].ravel()
+        })
+        table['value'] = table['edge'] > self.min_edge
+        table = table.dropna(subset=['odds', 'model_prob'])
+        return table.sort_values('edge', ascending=False).reset_index(drop=True)
+
+    def backtest(self, matches, probabilities, staking='flat'):
+        """
+        Geçmiş maçlarda edge > min_edge olan tüm bahisleri tüm pazarlarda aynı anda oynar.
+        probabilities: Her maç için o maçtan ÖNCEKİ bilgiyle (ve o maçı görmemiş modelle) üretilmiş
+        olasılıklar. predict_match kullanılamaz: bugünkü Elo/form ile ileriye bakma hatası yapar.
+        staking: 'flat' (1 birim) veya 'kelly' (Kelly oranı kadar).
+        price='max' ile sonuçlar her bahiste en iyi oranın alındığını varsayar; ROI iyimser üst sınırdır.
+        Pazar başına bahis sayısı, kâr ve ROI tablosu döndürür.
+        """
+        if probabilities is None:
+            raise ValueError("Backtest için maç anındaki (point-in-time) model olasılıkları verilmelidir.")
+        if self.price == 'max':
+            print("  -> UYARI: Backtest en iyi (max) oranlarla yapılıyor; ROI iyimser bir üst sınırdır.")
+        res = self._evaluate(matches, probabilities)
+
+        hs, as_ = matches['home_score'].to_numpy(), matches['away_score'].to_numpy()
+        total = hs + as_
+        won = np.column_stack([hs > as_, hs == as_, hs < as_, total > 2.5, total < 2.5])
+
+        placed = (res['edge'] > self.min_edge) & np.isfinite(res['odds'])
+        stake = np.where(placed, 1.0 if staking == 'flat' else res['kelly'], 0.0)
+        profit = np.where(won, stake * (np.nan_to_num(res['odds']) - 1), -stake)
+
+        n_bets = placed.sum(axis=0)
+        staked = stake.sum(axis=0)
+        summary = pd.DataFrame({
+            'market': self.market_names,
+            'n_bets': n_bets,
+            'hit_rate': np.divide((won & placed).sum(axis=0), n_bets,
+                                  out=np.zeros(len(n_bets)), where=n_bets > 0),
+            'staked': staked,
+            'profit': profit.sum(axis=0),
+            'price': self.price
+        })
+        summary['roi'] = np.divide(summary['profit'], staked, out=np.zeros(len(staked)), where=staked > 0)
+        return summary.sort_values('roi', ascending=False).reset_index(drop=True)
@@ -0,0 +1,209 @@
+# core/season_simulator.py
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+import config
+from core.model_trainer import ModelTrainer
+
+# Sonuç kodu (0 = Deplasman, 1 = Beraberlik, 2 = Ev) -> puan / gol farkı işareti
+_HOME_POINTS = np.array([0, 1, 3], dtype=np.float32)
+_AWAY_POINTS = np.array([3, 1, 0], dtype=np.float32)
+_GOAL_SIGN = np.array([-1, 0, 1], dtype=np.float32)
+
+
+def _run_simulation(payload):
+    """
+    Tek bir lig için Monte Carlo simülasyonu (süreç havuzunda çalışabilsin diye modül seviyesinde).
+    Tüm sezonlar NumPy dizileri üzerinde toplu olarak oynatılır, Python döngüsü sadece partiler üzerindedir.
+    """
+    n_teams = len(payload['teams'])
+    home_idx, away_idx = payload['home_idx'], payload['away_idx']
+    n_fixtures = len(home_idx)
+    n_sims, batch_size = payload['n_sims'], payload['batch_size']
+    rng = np.random.default_rng(payload['seed'])
+    margins = payload['margins'].astype(np.float32)
+
+    # Maç -> takım eşleme matrisleri (puanlar matris çarpımı ile toplanır)
+    home_map = np.zeros((n_fixtures, n_teams), dtype=np.float32)
+    away_map = np.zeros((n_fixtures, n_teams), dtype=np.float32)
+    home_map[np.arange(n_fixtures), home_idx] = 1.0
+    away_map[np.arange(n_fixtures), away_idx] = 1.0
+
+    # Sonuç kodları model ile aynı: 2 = Ev, 1 = Beraberlik, 0 = Deplasman
+    cum_probs = np.cumsum(payload['probs'][:, ::-1], axis=1)[:, :2].astype(np.float32)  # P(dep), P(dep)+P(ber)
+
+    position_counts = np.zeros(n_teams * n_teams, dtype=np.int64)
+    points_sum = np.zeros(n_teams, dtype=np.float64)
+
+    for start in range(0, n_sims, batch_size):
+        size = min(batch_size, n_sims - start)
+
+        # 1. Tüm maçların sonuçlarını tek seferde çek
+        u = rng.random((size, n_fixtures), dtype=np.float32)
+        outcome = (u >= cum_probs[:, 0]).view(np.int8) + (u >= cum_probs[:, 1]).view(np.int8)
+
+        home_pts = _HOME_POINTS[outcome]
+        away_pts = _AWAY_POINTS[outcome]
+
+        # 2. Averaj için gol farkı (ligin geçmiş galibiyet farklarından örneklenir)
+        margin = margins[rng.integers(0, len(margins), size=(size, n_fixtures), dtype=np.int32)]
+        home_gd = _GOAL_SIGN[outcome] * margin
+
+        # 3. Puan tablosu
+        points = payload['base_points'] + home_pts @ home_map + away_pts @ away_map
+        goal_diff = payload['base_goal_diff'] + home_gd @ home_map - home_gd @ away_map
+
+        # 4. Sıralama: Puan > Averaj > Kura
+        key = points.astype(np.float64) * 1e4 + goal_diff + rng.random((size, n_teams)) * 0.5
+        order = np.argsort(-key, axis=1)
+        ranks = np.empty_like(order)
+        ranks[np.arange(size)[:, None], order] = np.arange(n_teams)
+
+        position_counts += np.bincount((np.arange(n_teams) * n_teams + ranks).ravel(),
+                                       minlength=n_teams * n_teams)
+        points_sum += points.sum(axis=0)
+
+    return {
+        'position_probs': position_counts.reshape(n_teams, n_teams) / n_sims,
+        'exp_points': points_sum / n_sims
+    }
+
+
+class SeasonSimulator:
+    def __init__(self, trainer: ModelTrainer, predictor=None, n_sims=config.SIM_N_SEASONS, seed=None):
+        """
+        Kalan fikstürü Monte Carlo ile oynatıp lig tablosu olasılıklarını hesaplar.
+        predictor verilirse maç olasılıkları MatchPredictor'dan, verilmezse Elo'dan alınır.
+        """
+        self.trainer = trainer
+        self.predictor = predictor
+        self.n_sims = n_sims
+        self.seed = seed
+
+    def _season_start(self, league_matches):
+        last_date = league_matches['date'].max()
+        year = last_date.year if last_date.month >= 7 else last_date.year - 1
+        return pd.Timestamp(year=year, month=7, day=1)
+
+    def _elo_probabilities(self, fixtures, draw_rate):
+        home_elo = np.array([self.trainer.team_elos.get(t, config.INITIAL_ELO) for t in fixtures['home_team']])
+        away_elo = np.array([self.trainer.team_elos.get(t, config.INITIAL_ELO) for t in fixtures['away_team']])
+
+        expected_home = 1 / (1 + np.power(10, (away_elo - home_elo - config.SIM_HOME_ADVANTAGE) / 400))
+        # Beraberlik güçler eşitken en yüksek; ortalaması ligin geçmiş beraberlik oranına eşitlenir.
+        # Beklenen skor = P(ev) + P(ber)/2 olacak şekilde ev/deplasman payı sonra ayrılır
+        shape = 1 - np.abs(2 * expected_home - 1)
+        p_draw = np.minimum(draw_rate * shape / max(shape.mean(), 1e-9), shape)
+        p_home = np.clip(expected_home - p_draw / 2, 0, 1)
+        p_away = np.clip(1 - expected_home - p_draw / 2, 0, 1)
+        return np.column_stack([p_home, p_draw, p_away])
+
+    def _model_probabilities(self, fixtures):
+        rows = []
+        for home, away in zip(fixtures['home_team'], fixtures['away_team']):
+            out, _, _ = self.predictor.predict_match(home, away)
+            rows.append([out['home_win'], out['draw'], out['away_win']])
+        return np.array(rows, dtype=np.float64)
+
+    def _prepare(self, league_code, fixtures, season_start=None, seed=None):
+        """Süreç havuzuna gönderilecek, sadece NumPy dizilerinden oluşan paketi hazırlar."""
+        if league_code == 'INT':
+            raise ValueError("Milli maçlar için lig tablosu simülasyonu yapılamaz.")
+
+        history = self.trainer.all_results[self.trainer.all_results['league_code'] == league_code]
+        if history.empty:
+            raise ValueError(f"'{league_code}' için maç verisi bulunamadı.")
+
+        start = pd.Timestamp(season_start) if season_start else self._season_start(history)
+        played = history[history['date'] >= start]
+
+        teams = sorted(set(played['home_team']) | set(played['away_team']) |
+                       set(fixtures['home_team']) | set(fixtures['away_team']))
+        team_index = {team: i for i, team in enumerate(teams)}
+
+        # Mevcut tablo (oynanmış maçlar)
+        base_points = np.zeros(len(teams), dtype=np.float32)
+        base_goal_diff = np.zeros(len(teams), dtype=np.float32)
+        if not played.empty:
+            h = played['home_team'].map(team_index).to_numpy()
+            a = played['away_team'].map(team_index).to_numpy()
+            hs, as_ = played['home_score'].to_numpy(), played['away_score'].to_numpy()
+            home_pts = np.where(hs > as_, 3, np.where(hs == as_, 1, 0))
+            away_pts = np.where(as_ > hs, 3, np.where(hs == as_, 1, 0))
+            np.add.at(base_points, h, home_pts)
+            np.add.at(base_points, a, away_pts)
+            np.add.at(base_goal_diff, h, hs - as_)
+            np.add.at(base_goal_diff, a, as_ - hs)
+
+        diff = (history['home_score'] - history['away_score']).abs()
+        margins = diff[diff > 0].to_numpy()
+        if margins.size == 0:
+            margins = np.array([1])
+        draw_rate = float((diff == 0).mean())
+
+        if self.predictor is not None:
+            probs = self._model_probabilities(fixtures)
+        else:
+            probs = self._elo_probabilities(fixtures, draw_rate)
+        probs = probs / probs.sum(axis=1, keepdims=True)
+
+        return {
+            'league_code': league_code,
+            'teams': teams,
+            'home_idx': fixtures['home_team'].map(team_index).to_numpy(),
+            'away_idx': fixtures['away_team'].map(team_index).to_numpy(),
+            'probs': probs,
+            'base_points': base_points,
+            'base_goal_diff': base_goal_diff,
+            'margins': margins,
+            'n_sims': self.n_sims,
+            'batch_size': config.SIM_BATCH_SIZE,
+            'seed': seed if seed is not None else self.seed
+        }
+
+    def _build_table(self, payload, result):
+        teams = payload['teams']
+        n_teams = len(teams)
+        europe, relegation = config.LEAGUE_ZONES.get(payload['league_code'], (4, 3))
+        position_probs = result['position_probs']
+
+        table = pd.DataFrame({
+            'team': teams,
+            'points': payload['base_points'].astype(int),
+            'exp_points': result['exp_points'],
+            'exp_position': position_probs @ np.arange(1, n_teams + 1),
+            'p_title': position_probs[:, 0],
+            'p_europe': position_probs[:, :europe].sum(axis=1),
+            'p_relegation': position_probs[:, n_teams - relegation:].sum(axis=1)
+        })
+        positions = pd.DataFrame(position_probs, columns=[f"pos_{i}" for i in range(1, n_teams + 1)])
+        table = pd.concat([table, positions], axis=1)
+        return table.sort_values('exp_position').reset_index(drop=True)
+
+    def simulate_league(self, league_code, fixtures, season_start=None):
+        """
+        fixtures: 'home_team' ve 'away_team' sütunlarını içeren kalan maç listesi.
+        Takım başına şampiyonluk, Avrupa, düşme ve sıra olasılıklarını içeren tabloyu döndürür.
+        """
+        payload = self._prepare(league_code, fixtures, season_start)
+        print(f"🎲 {league_code}: {len(fixtures)} maç için {self.n_sims} sezon simüle ediliyor...")
+        return self._build_table(payload, _run_simulation(payload))
+
+    def simulate_all(self, fixtures_by_league, processes=None):
+        """
+        fixtures_by_league: {lig_kodu: kalan_maçlar_df}
+        processes > 1 ise her lig ayrı bir süreçte simüle edilir.
+        """
+        seeds = np.random.SeedSequence(self.seed).spawn(len(fixtures_by_league))
+        payloads = [self._prepare(code, fixtures, seed=seed)
+                    for (code, fixtures), seed in zip(fixtures_by_league.items(), seeds)]
+
+        print(f"🎲 {len(payloads)} lig için {self.n_sims} sezon simüle ediliyor...")
+        if processes and processes > 1:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                results = list(pool.map(_run_simulation, payloads))
+        else:
+            results = [_run_simulation(p) for p in payloads]
+
+        return {p['league_code']: self._build_table(p, r) for p, r in zip(payloads, results)}
@@ -0,0 +1,7 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# Testler depo kökünden 'config' ve 'core' modüllerini içe aktarabilsin
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,167 @@
+# tests/test_fixture_feed.py
+
+import json
+import threading
+import functools
+import pandas as pd
+import pytest
+from http.server import HTTPServer, SimpleHTTPRequestHandler, BaseHTTPRequestHandler
+from core import fixture_feed
+from core.fixture_feed import FixtureFeed, LocalDropProvider, HttpFixtureProvider
+
+DAY = pd.Timestamp('2026-10-19')
+ALL_RESULTS = pd.DataFrame({
+    'home_team': ['Man United', 'Arsenal', 'Bayern Munich'],
+    'away_team': ['Fulham', 'Chelsea', 'Dortmund']
+})
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Sabit içerik sunan, ETag / If-None-Match destekli yerel sunucu."""
+    files = {}
+    statuses = []
+
+    def do_GET(self):
+        body = self.files.get(self.path)
+        if body is None:
+            status = 404
+            self.send_response(404)
+            self.end_headers()
+        else:
+            etag = f'"{hash(body)}"'
+            if self.headers.get('If-None-Match') == etag:
+                status = 304
+                self.send_response(304)
+                self.end_headers()
+            else:
+                status = 200
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+        self.statuses.append((self.path, status))
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(handler):
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def etag_server():
+    ETagHandler.files = {}
+    ETagHandler.statuses = []
+    server = _serve(ETagHandler)
+    yield server
+    server.shutdown()
+
+
+def _http_feed(server, **kwargs):
+    provider = HttpFixtureProvider(f"http://127.0.0.1:{server.server_port}/{{league_code}}.json")
+    feed = FixtureFeed([provider], **kwargs)
+    feed.set_team_names(ALL_RESULTS)
+    return feed, provider
+
+
+def test_http_conditional_get_etag(etag_server):
+    ETagHandler.files['/E0.json'] = json.dumps(
+        [{'date': '2026-10-19', 'home': 'Manchester United FC', 'away': 'Fulham'}]).encode()
+    feed, provider = _http_feed(etag_server)
+
+    first = feed.get_matches('E0', DAY)
+    feed.clear_cache()
+    second = feed.get_matches('E0', DAY)
+
+    assert [s for _, s in ETagHandler.statuses] == [200, 304]
+    assert first.equals(second)
+    assert first[['home_team', 'away_team']].values.tolist() == [['Man United', 'Fulham']]
+
+
+def test_http_conditional_get_last_modified(tmp_path):
+    (tmp_path / 'E0.json').write_text(json.dumps([{'date': '2026-10-19', 'home': 'Arsenal', 'away': 'Chelsea'}]))
+    server = _serve(functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path)))
+    try:
+        provider = HttpFixtureProvider(f"http://127.0.0.1:{server.server_port}/{{league_code}}.json")
+        first = provider.fetch('E0')
+        url = provider.url_template.format(league_code='E0')
+        assert provider._validators[url][1] is not None
+
+        response = provider.session.get(url, headers={'If-Modified-Since': provider._validators[url][1]})
+        assert response.status_code == 304
+        assert provider.fetch('E0') is first
+    finally:
+        server.shutdown()
+
+
+def test_http_404_returns_empty_slate(etag_server):
+    feed, provider = _http_feed(etag_server)
+    assert provider.fetch('I1') is None
+    df = feed.get_matches('I1', DAY)
+    assert df.empty
+    assert list(df.columns) == fixture_feed.FIXTURE_COLUMNS
+
+
+def test_drop_folder_csv_and_json(tmp_path):
+    (tmp_path / 'D1.csv').write_text("Date,HomeTeam,AwayTeam\n19/10/2026,Bayern München,Borussia Dortmund\n"
+                                     "20/10/2026,Dortmund,Bayern Munich\n", encoding='utf-8')
+    (tmp_path / 'E0.json').write_text(json.dumps({'matches': [
+        {'date': '2026-10-19', 'home': 'Manchester United FC', 'away': 'Fulham', 'odds_home': 1.8}]}))
+    feed = FixtureFeed([LocalDropProvider(str(tmp_path))])
+    feed.set_team_names(ALL_RESULTS)
+
+    d1 = feed.get_matches('D1', DAY)
+    assert d1[['home_team', 'away_team']].values.tolist() == [['Bayern Munich', 'Dortmund']]
+
+    e0 = feed.get_matches('E0', DAY)
+    assert e0[['home_team', 'away_team']].values.tolist() == [['Man United', 'Fulham']]
+    assert e0['odds_home'].tolist() == [1.8]
+
+
+def test_cache_is_not_shared_between_feeds(tmp_path):
+    for name, home in (('a', 'Arsenal'), ('b', 'Man United')):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'E0.json').write_text(json.dumps([{'date': '2026-10-19', 'home': home, 'away': 'Fulham'}]))
+    feed_a = FixtureFeed([LocalDropProvider(str(tmp_path / 'a'))])
+    feed_b = FixtureFeed([LocalDropProvider(str(tmp_path / 'b'))])
+
+    assert feed_a.get_matches('E0', DAY)['home_team'].tolist() == ['Arsenal']
+    assert feed_b.get_matches('E0', DAY)['home_team'].tolist() == ['Man United']
+
+
+def test_all_timestamps_with_timezone(etag_server):
+    ETagHandler.files['/E0.json'] = json.dumps([
+        {'date': '2026-10-19T12:30:00Z', 'home': 'Arsenal', 'away': 'Chelsea'},
+        {'date': '2026-10-19T15:00:00+00:00', 'home': 'Man United', 'away': 'Fulham'}]).encode()
+    feed, _ = _http_feed(etag_server)
+
+    df = feed.get_matches('E0', DAY)
+    assert len(df) == 2
+    assert df['date'].dt.tz is None
+
+
+def test_mixed_timezones_do_not_break_other_leagues(etag_server):
+    ETagHandler.files['/E0.json'] = json.dumps([
+        {'date': '2026-10-19T12:30:00Z', 'home': 'Arsenal', 'away': 'Chelsea'},
+        {'date': '2026-10-19 15:00', 'home': 'Man United', 'away': 'Fulham'}]).encode()
+    ETagHandler.files['/D1.json'] = json.dumps([
+        {'date': '2026-10-19', 'home': 'Bayern Munich', 'away': 'Dortmund'}]).encode()
+    feed, _ = _http_feed(etag_server)
+
+    df = feed.get_all(['E0', 'D1', 'I1'], DAY)
+    assert sorted(df['league_code'].tolist()) == ['D1', 'E0', 'E0']
+
+
+def test_normalization_error_is_caught_per_provider(tmp_path, monkeypatch):
+    (tmp_path / 'E0.json').write_text(json.dumps([{'date': '2026-10-19', 'home': 'Arsenal', 'away': 'Chelsea'}]))
+    feed = FixtureFeed([LocalDropProvider(str(tmp_path))])
+
+    def broken(*args):
+        raise ValueError("bozuk veri")
+    monkeypatch.setattr(feed, '_normalize', broken)
+
+    assert feed.get_matches('E0', DAY).empty
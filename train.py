@@ -2,15 +2,28 @@
 import argparse
 from core.data_manager import DataManager
 from core.model_trainer import ModelTrainer
+from core.elo_calibrator import EloCalibrator
 
 def main():
     parser = argparse.ArgumentParser(description="Futbol tahmin modellerini eğitir.")
     parser.add_argument("--train", action="store_true", help="Verilerden modelleri eğitir.")
+    parser.add_argument("--deep-history", action="store_true",
+                        help="Son 3 sezon yerine disk deposundaki tüm sezonları kullanır.")
+    parser.add_argument("--calibrate-elo", action="store_true", help="K_FACTOR ve LEAGUE_WEIGHTS için öneri üretir.")
+    parser.add_argument("--rebuild-history", action="store_true",
+                        help="data/history deposunu tüm sezonlarla baştan oluşturur.")
     args = parser.parse_args()
 
-    if args.train:
+    if args.rebuild_history:
+        DataManager().ingest_deep_history()
+
+    if args.calibrate_elo:
+        data_manager = DataManager(deep_history=args.deep_history)
+        _, elo_results_df = data_manager.load_all_data()
+        EloCalibrator(elo_results_df).run()
+    elif args.train:
         # 1. Veriyi yükle (artık 2 dataframe dönüyor)
-        data_manager = DataManager()
+        data_manager = DataManager(deep_history=args.deep_history)
         all_results_df, elo_results_df = data_manager.load_all_data()
 
         # 2. Model eğiticiyi iki dataframe ile başlat
@@ -21,7 +34,7 @@ def main():
 
         # 4. Modelleri eğit ve kaydet
         trainer.train_and_save_all(X, y_dict)
-    else:
+    elif not args.rebuild_history:
         print("Modeli eğitmek için '--train' argümanını kullanın.")
         print("Örnek: python train.py --train")
 